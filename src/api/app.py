@@ -1,30 +1,79 @@
 """Boxarr API application."""
 
-from typing import Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from .. import __version__
-from ..core.radarr import RadarrService
-from ..core.scheduler import BoxarrScheduler
-from ..utils.config import settings
+from ..utils.config import get_settings, settings
 from ..utils.logger import get_logger
-from .routes import (
-    admin_router,
-    boxoffice_router,
-    config_router,
-    movies_router,
-    scheduler_router,
-    web_router,
-)
+from .health_interceptor import HealthCheckInterceptor
+from .responses import FastJSONResponse
+from .static_files import CachedStaticFiles
+
+if TYPE_CHECKING:
+    from ..core.scheduler import BoxarrScheduler
 
 logger = get_logger(__name__)
 
 
-def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
+def _check_radarr_connection() -> bool:
+    """Test the Radarr connection (blocking; run in a worker thread)."""
+    from ..core.radarr import RadarrService
+
+    try:
+        with RadarrService() as r:
+            return bool(r.test_connection())
+    except Exception as e:
+        logger.debug(f"Radarr connectivity check failed: {e}")
+        return False
+
+
+async def _refresh_radarr_status(app: FastAPI) -> None:
+    """Periodically refresh the cached Radarr connectivity status."""
+    while True:
+        if settings.radarr_api_key:
+            connected = await asyncio.to_thread(_check_radarr_connection)
+        else:
+            connected = False
+        app.state.radarr_status = {"connected": connected, "ts": time.time()}
+        await asyncio.sleep(settings.radarr_cache_ttl_seconds)
+
+
+def _include_routers(app: FastAPI) -> None:
+    """Attach all API and web routers to the app.
+
+    Imported here rather than at module level so that importing this module
+    doesn't pull in the routes and the services they depend on.
+    """
+    from .routes import (
+        admin_router,
+        boxoffice_router,
+        config_router,
+        movies_router,
+        scheduler_router,
+        web_router,
+    )
+
+    for router in (
+        admin_router,
+        config_router,
+        boxoffice_router,
+        movies_router,
+        scheduler_router,
+        web_router,
+    ):
+        app.include_router(router)
+
+
+def create_app(
+    scheduler: Optional["BoxarrScheduler"] = None,
+) -> HealthCheckInterceptor:
     """
     Create and configure the FastAPI application.
 
@@ -32,21 +81,63 @@ def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
         scheduler: Optional scheduler instance for background tasks
 
     Returns:
-        Configured FastAPI application
+        Configured FastAPI application wrapped in the health check interceptor;
+        the FastAPI instance itself is available as ``.app``
     """
-    # Prepare root_path from settings
-    base = settings.boxarr_url_base
+    # Snapshot the settings needed to build the app, resolving the lazy
+    # settings proxy once instead of on every read below. These only shape
+    # the app (routing, docs, CORS, scheduler start); the Radarr status
+    # refresh and the health check read the live settings instead.
+    current_settings = get_settings()
+    base = current_settings.boxarr_url_base
     root_path = f"/{base}" if base else ""
+    enable_docs = current_settings.boxarr_enable_docs
+    cors_origins = current_settings.boxarr_cors_origins
+    scheduler_enabled = current_settings.boxarr_scheduler_enabled
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Start background services on startup and stop them on shutdown."""
+        logger.info("Boxarr API starting up...")
+
+        # Start scheduler if configured and enabled
+        if scheduler and scheduler_enabled:
+            scheduler.start()
+            logger.info("Scheduler started")
+
+        # Keep Radarr status warm for the health check; started even without
+        # an API key so a key saved after startup is picked up
+        radarr_status_task = asyncio.create_task(_refresh_radarr_status(app))
+
+        yield
+
+        logger.info("Boxarr API shutting down...")
+
+        # Stop Radarr status refresh
+        radarr_status_task.cancel()
+
+        # Stop scheduler if running
+        if scheduler:
+            scheduler.stop()
+            logger.info("Scheduler stopped")
 
     app = FastAPI(
         title="Boxarr",
         description="Box Office Tracking for Radarr - A local media management tool",
         version=__version__,
         root_path=root_path,
-        docs_url="/api/docs",
-        redoc_url="/api/redoc",
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
+        # API docs (and the OpenAPI schema behind them) are opt-in
+        docs_url="/api/docs" if enable_docs else None,
+        redoc_url="/api/redoc" if enable_docs else None,
+        openapi_url="/openapi.json" if enable_docs else None,
     )
 
+    # Middleware added last runs first: ProxyHeaders is added before CORS so
+    # that CORS is the outermost layer and answers preflights / rejects
+    # unknown origins without the proxy header rewriting running at all.
+
     # Add ProxyHeadersMiddleware to handle reverse proxy headers
     # Note: Remove trusted_hosts parameter for better security
     # Only add specific hosts if needed: trusted_hosts=["proxy.example.com"]
@@ -55,21 +146,19 @@ def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
     # Add CORS middleware for local network access
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Allow all origins for local use
+        allow_origins=cors_origins,  # Default ["*"] for local use
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
     # Mount static files
-    app.mount("/static", StaticFiles(directory="src/web/static"), name="static")
+    app.mount("/static", CachedStaticFiles(directory="src/web/static"), name="static")
 
     # Include routers
-    app.include_router(admin_router)
-    app.include_router(config_router)
-    app.include_router(boxoffice_router)
-    app.include_router(movies_router)
-    app.include_router(scheduler_router)
-    app.include_router(web_router)
+    _include_routers(app)
+
+    # Cached Radarr connectivity, refreshed off the request path
+    app.state.radarr_status = {"connected": False, "ts": 0}
 
     # Store scheduler instance if provided
     if scheduler:
@@ -80,52 +169,14 @@ def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
         # Set the module-level variable correctly
         scheduler_routes._scheduler = scheduler
 
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize application on startup."""
-        logger.info("Boxarr API starting up...")
-
-        # Start scheduler if configured and enabled
-        if scheduler and settings.boxarr_scheduler_enabled:
-            scheduler.start()
-            logger.info("Scheduler started")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        """Cleanup on application shutdown."""
-        logger.info("Boxarr API shutting down...")
-
-        # Stop scheduler if running
-        if scheduler:
-            scheduler.stop()
-            logger.info("Scheduler stopped")
-
-    @app.get("/api/health")
-    async def health_check():
-        """Simple health check endpoint."""
-        radarr_connected = False
-        if settings.radarr_api_key:
-            try:
-                with RadarrService() as r:
-                    radarr_connected = r.test_connection()
-            except Exception:
-                radarr_connected = False
-
-        return {
-            "status": "healthy",
-            "version": __version__,
-            "radarr_configured": bool(settings.radarr_api_key),
-            "radarr_connected": radarr_connected,
-            "scheduler_enabled": settings.boxarr_scheduler_enabled,
-        }
-
-    return app
+    return HealthCheckInterceptor(app)
 
 
-def create_app_with_scheduler() -> FastAPI:
+def create_app_with_scheduler() -> HealthCheckInterceptor:
     """Create application with scheduler enabled."""
     from ..core.boxoffice import BoxOfficeService
     from ..core.radarr import RadarrService
+    from ..core.scheduler import BoxarrScheduler
 
     # Initialize scheduler with services
     scheduler = BoxarrScheduler(
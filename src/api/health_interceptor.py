@@ -0,0 +1,86 @@
+"""Lightweight ASGI health check interceptor for Boxarr."""
+
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+from .. import __version__
+from ..utils.config import settings
+
+HEALTH_PATH = "/api/health"
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI wrapper that answers ``GET /api/health`` before FastAPI.
+
+    Health probes never reach the middleware stack or the router. The JSON
+    body is serialized once per distinct state and served from memory. The
+    Radarr connectivity flag is read from ``app.state.radarr_status``, which
+    the application refreshes in the background, so a probe never waits on
+    Radarr.
+    """
+
+    def __init__(self, app: Any):
+        """
+        Initialize interceptor.
+
+        Args:
+            app: Wrapped ASGI application (the FastAPI instance)
+        """
+        self.app = app
+        self._body_key: Optional[Tuple[bool, bool, bool]] = None
+        self._body = b""
+
+    async def __call__(self, scope: Dict, receive: Any, send: Any) -> None:
+        """Serve health probes directly and pass everything else through."""
+        if scope["type"] == "http" and scope["path"].endswith(HEALTH_PATH):
+            if scope["method"] != "GET":
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 405,
+                        "headers": [(b"allow", b"GET")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            body = self._cached_body()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self.app(scope, receive, send)
+
+    def _cached_body(self) -> bytes:
+        """Return the serialized health payload, rebuilding it only on change."""
+        radarr_configured = bool(settings.radarr_api_key)
+        radarr_status = getattr(self.app.state, "radarr_status", None) or {}
+
+        key = (
+            radarr_configured,
+            radarr_configured and bool(radarr_status.get("connected", False)),
+            bool(settings.boxarr_scheduler_enabled),
+        )
+        if key != self._body_key:
+            self._body = orjson.dumps(
+                {
+                    "status": "healthy",
+                    "version": __version__,
+                    "radarr_configured": key[0],
+                    "radarr_connected": key[1],
+                    "scheduler_enabled": key[2],
+                }
+            )
+            self._body_key = key
+        return self._body
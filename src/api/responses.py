@@ -0,0 +1,18 @@
+"""Response classes for the Boxarr API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module.
+
+    Used as the application's default response class. FastAPI's own
+    ``ORJSONResponse`` is deprecated, so this keeps the same rendering
+    without the deprecation warning.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
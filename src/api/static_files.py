@@ -0,0 +1,93 @@
+"""In-memory cached static file serving for Boxarr."""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+
+class _CachedAsset(NamedTuple):
+    """A static file held in memory with its response headers."""
+
+    body: bytes
+    headers: Dict[str, str]
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that keeps hot assets in a bounded in-memory LRU.
+
+    The bundled assets never change while the process runs, so each file is
+    looked up and read from disk once; later GET requests are answered from
+    memory without a ``stat()`` or file descriptor. HEAD and range requests
+    are passed through to StaticFiles unchanged.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        max_entries: int = 200,
+        max_bytes: int = 32 * 1024 * 1024,
+        **kwargs: Any,
+    ):
+        """
+        Initialize cached static files.
+
+        Args:
+            max_entries: Maximum number of files kept in memory
+            max_bytes: Maximum total size of cached file contents
+        """
+        super().__init__(*args, **kwargs)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[str, _CachedAsset]" = OrderedDict()
+        self._cache_bytes = 0
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve from the cache, populating it from disk on a miss."""
+        request_headers = Headers(scope=scope)
+        if scope["method"] != "GET" or "range" in request_headers:
+            return await super().get_response(path, scope)
+
+        asset = self._cache.get(path)
+        if asset is None:
+            response = await super().get_response(path, scope)
+            if not isinstance(response, FileResponse) or response.status_code != 200:
+                return response
+
+            size = int(response.headers["content-length"])
+            if size > self.max_bytes:
+                return response
+
+            body = await anyio.to_thread.run_sync(Path(response.path).read_bytes)
+            headers = dict(response.headers)
+            headers["content-length"] = str(len(body))
+            asset = _CachedAsset(body, headers)
+            self._store(path, asset)
+        else:
+            self._cache.move_to_end(path)
+            if self.is_not_modified(Headers(asset.headers), request_headers):
+                return NotModifiedResponse(Headers(asset.headers))
+
+        return Response(content=asset.body, headers=asset.headers)
+
+    def _store(self, path: str, asset: _CachedAsset) -> None:
+        """Add an asset, evicting least recently used entries over the limits."""
+        # Concurrent misses on the same path each read the file; replace the
+        # earlier copy rather than counting its bytes twice
+        previous = self._cache.pop(path, None)
+        if previous is not None:
+            self._cache_bytes -= len(previous.body)
+        self._cache[path] = asset
+        self._cache_bytes += len(asset.body)
+        while self._cache and (
+            len(self._cache) > self.max_entries or self._cache_bytes > self.max_bytes
+        ):
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= len(evicted.body)
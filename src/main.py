@@ -2,14 +2,23 @@
 """Main entry point for Boxarr application."""
 
 import asyncio
+import importlib
 import signal
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Optional
 
 import uvicorn
 
 from src.utils.logger import setup_logging
 
+uvloop: Optional[ModuleType]
+try:
+    uvloop = importlib.import_module("uvloop")
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 # Setup logging first, before any other imports that might use logging
 setup_logging()
 
@@ -84,6 +93,7 @@ class BoxarrApplication:
             app=self.app,
             host=settings.boxarr_host,
             port=settings.boxarr_port,
+            http="httptools",
             log_level=settings.log_level.lower(),
             access_log=True,
         )
@@ -218,11 +228,22 @@ def cli():
     # Map update mode to cli
     mode = "cli" if args.mode == "update" else args.mode
 
-    # Run application
+    # Run application on uvloop; silently falling back to the pure-Python
+    # event loop would slow down every request
+    if uvloop is None and sys.platform != "win32":
+        logger.error(
+            "uvloop is not installed. Install uvicorn[standard] "
+            "(pip install -r requirements-prod.txt)."
+        )
+        sys.exit(1)
+
     app = BoxarrApplication()
 
     try:
-        asyncio.run(app.main(mode))
+        if uvloop is not None:
+            uvloop.run(app.main(mode))
+        else:
+            asyncio.run(app.main(mode))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
@@ -1,16 +1,40 @@
 """Configuration management for Boxarr using pydantic-settings."""
 
 import os
+import re
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.utils import yaml_loader
 
+__all__ = [
+    "MinimumAvailabilityEnum",
+    "MonitorEnum",
+    "RootFolderConfig",
+    "RootFolderMapping",
+    "Settings",
+    "ThemeEnum",
+    "get_settings",
+    "load_settings",
+    "settings",
+]
+
 
 class ThemeEnum(str, Enum):
     """Available UI themes."""
@@ -23,6 +47,19 @@ class ThemeEnum(str, Enum):
     BLUE = "blue"  # Will be mapped to LIGHT
 
 
+# A valid auto tag: a single word of at most 20 characters
+_AUTO_TAG_RE = re.compile(r"\S{1,20}")
+
+# Legacy theme values and their replacements (ThemeEnum members hash like
+# their string values, so "purple" also covers ThemeEnum.PURPLE)
+_LEGACY_THEME_MAP: Dict[Any, ThemeEnum] = {
+    "purple": ThemeEnum.LIGHT,
+    "PURPLE": ThemeEnum.LIGHT,
+    "blue": ThemeEnum.LIGHT,
+    "BLUE": ThemeEnum.LIGHT,
+}
+
+
 class MonitorEnum(str, Enum):
     """Radarr monitor options."""
 
@@ -40,9 +77,20 @@ class MinimumAvailabilityEnum(str, Enum):
     PRE_DB = "preDb"
 
 
+# Deprecated minimum availability values and their safe replacements
+_DEPRECATED_MINIMUM_AVAILABILITY: Dict[
+    MinimumAvailabilityEnum, MinimumAvailabilityEnum
+] = {
+    MinimumAvailabilityEnum.PRE_DB: MinimumAvailabilityEnum.ANNOUNCED,
+}
+
+
 class RootFolderMapping(BaseModel):
     """Mapping of genres to root folders."""
 
+    # Frozen so a matched mapping can't change under normalized_mappings
+    model_config = ConfigDict(frozen=True)
+
     genres: List[str] = Field(description="List of genres for this mapping")
     root_folder: str = Field(description="Root folder path for these genres")
     priority: int = Field(
@@ -50,14 +98,82 @@ class RootFolderMapping(BaseModel):
     )
 
 
+# Pre-normalized (genres, root_folder) pairs in rule order
+NormalizedMappings = Tuple[Tuple[FrozenSet[str], str], ...]
+
+
 class RootFolderConfig(BaseModel):
-    """Configuration for root folder mappings."""
+    """Configuration for root folder mappings.
+
+    ``mappings`` is stored as a tuple of frozen mappings so lookups can reuse
+    one normalized copy; replace the whole sequence to change the rules. Each
+    mapping's ``genres`` list is not copied, so don't edit it in place either.
+    """
+
+    # Validate assignment so a reassigned list is stored as a tuple too
+    model_config = ConfigDict(validate_assignment=True)
 
     enabled: bool = Field(default=False, description="Enable root folder mappings")
-    mappings: List[RootFolderMapping] = Field(
-        default_factory=list, description="List of genre to root folder mappings"
+    mappings: Tuple[RootFolderMapping, ...] = Field(
+        default_factory=tuple, description="List of genre to root folder mappings"
     )
 
+    _normalized: Optional[NormalizedMappings] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "mappings":
+            self._normalized = None
+
+    @property
+    def normalized_mappings(self) -> NormalizedMappings:
+        """Mappings as ``(genres, root_folder)`` pairs, genres casefolded once."""
+        if self._normalized is None:
+            self._normalized = tuple(
+                (frozenset(g.casefold().strip() for g in m.genres), m.root_folder)
+                for m in self.mappings
+            )
+        return self._normalized
+
+
+@lru_cache(maxsize=512)
+def _match_root_folder(
+    mappings: NormalizedMappings, genres: FrozenSet[str]
+) -> Optional[str]:
+    """Return the root folder of the first mapping sharing a genre, if any."""
+    for mapping_genres, root_folder in mappings:
+        # isdisjoint stops at the first shared genre instead of building
+        # the full intersection
+        if not genres.isdisjoint(mapping_genres):
+            return root_folder
+    return None
+
+
+# Attribute prefix for each nested YAML section; keys of any other mapping
+# are used as-is (top level) or prefixed by their enclosing section.
+_YAML_SECTION_PREFIXES: Dict[str, str] = {
+    "radarr": "radarr_",
+    "boxarr": "boxarr_",
+    "boxarr.scheduler": "boxarr_scheduler_",
+    "boxarr.features": "boxarr_features_",
+    "boxarr.features.auto_add_options": "boxarr_features_auto_add_",
+    "boxarr.ui": "boxarr_ui_",
+    "boxarr.ui.cards_per_row": "boxarr_ui_cards_per_row_",
+    "boxarr.data": "boxarr_data_",
+}
+
+
+def _flatten(
+    cfg: Dict[str, Any], path: str = "", prefix: str = ""
+) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(attr_name, value)`` pairs for a nested YAML config mapping."""
+    for key, value in cfg.items():
+        key_path = f"{path}.{key}" if path else str(key)
+        if isinstance(value, dict) and key_path in _YAML_SECTION_PREFIXES:
+            yield from _flatten(value, key_path, _YAML_SECTION_PREFIXES[key_path])
+        else:
+            yield f"{prefix}{key}", value
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -116,6 +232,14 @@ class Settings(BaseSettings):
         default="",
         description="URL base path for reverse proxy (e.g., 'boxarr' for /boxarr/)",
     )
+    boxarr_enable_docs: bool = Field(
+        default=False,
+        description="Expose interactive API docs at /api/docs and /api/redoc",
+    )
+    boxarr_cors_origins: List[str] = Field(
+        default_factory=lambda: ["*"],
+        description="Origins allowed for cross-origin requests ('*' allows all)",
+    )
 
     # Scheduler Configuration
     boxarr_scheduler_enabled: bool = Field(
@@ -135,11 +259,10 @@ class Settings(BaseSettings):
     @validator("boxarr_ui_theme", pre=True)
     def migrate_legacy_theme(cls, v):
         """Migrate legacy theme values to new theme system."""
-        if v in ["purple", "PURPLE", ThemeEnum.PURPLE]:
-            return ThemeEnum.LIGHT
-        if v in ["blue", "BLUE", ThemeEnum.BLUE]:
-            return ThemeEnum.LIGHT
-        return v
+        try:
+            return _LEGACY_THEME_MAP.get(v, v)
+        except TypeError:  # Unhashable input; let field validation reject it
+            return v
 
     boxarr_ui_cards_per_row_mobile: int = Field(
         default=1, ge=1, le=3, description="Cards per row on mobile"
@@ -258,9 +381,10 @@ class Settings(BaseSettings):
         # Enforce non-empty, no whitespace, max 20 chars
         if not s:
             return "boxarr"
-        if any(ch.isspace() for ch in s):
-            raise ValueError("Auto tag must be a single word without spaces")
-        if len(s) > 20:
+        if not _AUTO_TAG_RE.fullmatch(s):
+            # Slow path only to pick the right error message
+            if any(ch.isspace() for ch in s):
+                raise ValueError("Auto tag must be a single word without spaces")
             raise ValueError("Auto tag must be at most 20 characters")
         return s
 
@@ -281,97 +405,40 @@ class Settings(BaseSettings):
 
     def load_from_yaml(self, config_path: Path) -> None:
         """Load configuration from YAML file."""
-        if config_path.exists():
-            #  with open(config_path) as f:
-            #      config_data = yaml.safe_load(f)
-            config_data = yaml_loader.load_yaml(config_path)
-
-            # Process configuration sections
-            for section, values in config_data.items():
-                if section == "version":
-                    continue  # Skip version field
-                elif section == "radarr" and isinstance(values, dict):
-                    # Map radarr section directly
-                    for key, value in values.items():
-                        if key == "root_folder_config" and isinstance(value, dict):
-                            # Handle root folder config specially
-                            config = RootFolderConfig()
-                            if "enabled" in value:
-                                config.enabled = value["enabled"]
-                            if "mappings" in value and isinstance(
-                                value["mappings"], list
-                            ):
-                                config.mappings = [
-                                    RootFolderMapping(**mapping)
-                                    for mapping in value["mappings"]
-                                ]
-                            setattr(self, "radarr_root_folder_config", config)
-                        elif key == "minimum_availability":
-                            # Coerce string to enum safely and normalize deprecated values
-                            try:
-                                enum_val = MinimumAvailabilityEnum(value)
-                                if enum_val == MinimumAvailabilityEnum.PRE_DB:
-                                    # Map deprecated preDb to a safe default
-                                    enum_val = MinimumAvailabilityEnum.ANNOUNCED
-                                setattr(self, "radarr_minimum_availability", enum_val)
-                            except Exception:
-                                # Fall back to default if invalid
-                                pass
-                        else:
-                            attr_name = f"radarr_{key}"
-                            if hasattr(self, attr_name):
-                                setattr(self, attr_name, value)
-                elif section == "boxarr" and isinstance(values, dict):
-                    # Process boxarr nested configuration
-                    for key, value in values.items():
-                        if key == "scheduler" and isinstance(value, dict):
-                            for sub_key, sub_value in value.items():
-                                attr_name = f"boxarr_scheduler_{sub_key}"
-                                if hasattr(self, attr_name):
-                                    setattr(self, attr_name, sub_value)
-                        elif key == "features" and isinstance(value, dict):
-                            for sub_key, sub_value in value.items():
-                                if sub_key == "auto_add_options" and isinstance(
-                                    sub_value, dict
-                                ):
-                                    # Handle nested auto_add_options
-                                    for opt_key, opt_value in sub_value.items():
-                                        attr_name = (
-                                            f"boxarr_features_auto_add_{opt_key}"
-                                        )
-                                        if hasattr(self, attr_name):
-                                            setattr(self, attr_name, opt_value)
-                                else:
-                                    attr_name = f"boxarr_features_{sub_key}"
-                                    if hasattr(self, attr_name):
-                                        setattr(self, attr_name, sub_value)
-                        elif key == "ui" and isinstance(value, dict):
-                            for sub_key, sub_value in value.items():
-                                if sub_key == "cards_per_row" and isinstance(
-                                    sub_value, dict
-                                ):
-                                    for device, count in sub_value.items():
-                                        attr_name = f"boxarr_ui_cards_per_row_{device.replace('4k', '_4k')}"
-                                        if hasattr(self, attr_name):
-                                            setattr(self, attr_name, count)
-                                else:
-                                    attr_name = f"boxarr_ui_{sub_key}"
-                                    if hasattr(self, attr_name):
-                                        setattr(self, attr_name, sub_value)
-                        elif key == "data" and isinstance(value, dict):
-                            for sub_key, sub_value in value.items():
-                                attr_name = f"boxarr_data_{sub_key}"
-                                if hasattr(self, attr_name):
-                                    setattr(self, attr_name, sub_value)
-                        else:
-                            # Direct boxarr attributes
-                            attr_name = f"boxarr_{key}"
-                            if hasattr(self, attr_name):
-                                setattr(self, attr_name, value)
-                else:
-                    # Top-level attributes (like log_level)
-                    if hasattr(self, section):
-                        setattr(self, section, values)
+        if not config_path.exists():
+            return
+
+        config_data = yaml_loader.load_yaml(config_path)
+        if not isinstance(config_data, dict):
+            return
+
+        fields = type(self).model_fields
+        flat: Dict[str, Any] = {}
+        for attr_name, value in _flatten(config_data):
+            if attr_name == "radarr_root_folder_config" and isinstance(value, dict):
+                # Handle root folder config specially
+                config = RootFolderConfig()
+                if "enabled" in value:
+                    config.enabled = value["enabled"]
+                if "mappings" in value and isinstance(value["mappings"], list):
+                    config.mappings = tuple(
+                        RootFolderMapping(**mapping) for mapping in value["mappings"]
+                    )
+                value = config
+            elif attr_name == "radarr_minimum_availability":
+                # Coerce string to enum safely and normalize deprecated values
+                try:
+                    value = MinimumAvailabilityEnum(value)
+                except ValueError:
+                    # Fall back to default if invalid
+                    continue
+                value = _DEPRECATED_MINIMUM_AVAILABILITY.get(value, value)
+            if attr_name in fields:
+                flat[attr_name] = value
+
+        # Apply all values in one update instead of one setattr per key
+        updated = self.model_copy(update=flat)
+        self.__dict__.update(updated.__dict__)
 
     def get_root_folder_for_genres(
         self, genres: List[str], default: Optional[str] = None
@@ -393,14 +460,16 @@ class Settings(BaseSettings):
         if not self.radarr_root_folder_config.enabled:
             return default or str(self.radarr_root_folder)
 
-        # Normalize movie genres to lowercase for case-insensitive matching
-        normalized_movie_genres = {g.lower().strip() for g in genres}
+        # Casefold movie genres for case-insensitive matching
+        normalized_movie_genres = frozenset(g.casefold().strip() for g in genres)
 
         # Evaluate in list order; first match wins
-        for mapping in self.radarr_root_folder_config.mappings:
-            normalized_mapping_genres = {g.lower().strip() for g in mapping.genres}
-            if normalized_movie_genres & normalized_mapping_genres:
-                return mapping.root_folder
+        root_folder = _match_root_folder(
+            self.radarr_root_folder_config.normalized_mappings,
+            normalized_movie_genres,
+        )
+        if root_folder is not None:
+            return root_folder
 
         return default or str(self.radarr_root_folder)
 
@@ -446,6 +515,7 @@ class Settings(BaseSettings):
         """Reload settings from file by clearing the cache."""
         global _settings
         _settings = None  # Clear cache to force reload
+        _match_root_folder.cache_clear()
 
 
 # Lazy-loaded settings to avoid import-time side effects
@@ -460,24 +530,36 @@ def load_settings() -> Settings:
     # Create settings with potentially overridden data directory
     settings = Settings(boxarr_data_directory=Path(data_dir))
 
-    # Try to load from config file
-    config_paths = [
-        Path(data_dir) / "local.yaml",
-        Path(data_dir) / "config.yaml",
-        Path("config/local.yaml"),
-        Path("config/default.yaml"),
-        Path("/config/local.yaml"),  # Docker volume
-        Path("/config/config.yaml"),
+    # Try to load from config file, in priority order. Candidates are grouped
+    # by directory so each directory is listed once rather than stat()ing
+    # every candidate path.
+    config_dirs = [
+        (Path(data_dir), ["local.yaml", "config.yaml"]),
+        (Path("config"), ["local.yaml", "default.yaml"]),
+        (Path("/config"), ["local.yaml", "config.yaml"]),  # Docker volume
     ]
 
-    for config_path in config_paths:
-        if config_path.exists():
-            settings.load_from_yaml(config_path)
-            break
+    listings: Dict[Path, Set[str]] = {}
+    for directory, names in config_dirs:
+        if directory not in listings:
+            listings[directory] = _list_files(directory)
+        for name in names:
+            if name in listings[directory]:
+                settings.load_from_yaml(directory / name)
+                return settings
 
     return settings
 
 
+def _list_files(directory: Path) -> Set[str]:
+    """Return the names of regular files in directory (empty if unreadable)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
 def get_settings() -> Settings:
     """Get settings instance (lazy-loaded to avoid import side effects)."""
     global _settings
@@ -490,11 +572,16 @@ def get_settings() -> Settings:
 class SettingsProxy:
     """Proxy for lazy-loading settings."""
 
+    __slots__ = ()
+
     def __getattr__(self, name):
-        return getattr(get_settings(), name)
+        # Read the module global directly; only call get_settings() to load
+        instance = _settings if _settings is not None else get_settings()
+        return getattr(instance, name)
 
     def __setattr__(self, name, value):
-        setattr(get_settings(), name, value)
+        instance = _settings if _settings is not None else get_settings()
+        setattr(instance, name, value)
 
 
 # Export settings as a proxy for lazy loading
@@ -15,23 +15,32 @@ from typing import Any
 import yaml
 from yaml.parser import ParserError
 
+try:
+    # libyaml-backed parser is several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 _var_matcher = re.compile(r"\${([^}^{]+)}")
 _tag_matcher = re.compile(r"[^$]*\${([^}^{]+)}.*")
 
 
 def _path_constructor(_loader: Any, node: Any):
     def replace_fn(match):
-        envparts = f"{match.group(1)}:".split(":")
-        return os.environ.get(envparts[0], envparts[1])
+        name, _, default = match.group(1).partition(":")
+        return os.environ.get(name, default)
 
     return _var_matcher.sub(replace_fn, node.value)
 
 
+# Register the env var resolver once, on the loader class used below
+yaml.add_implicit_resolver("!envvar", _tag_matcher, None, SafeLoader)
+yaml.add_constructor("!envvar", _path_constructor, SafeLoader)
+
+
 def load_yaml(config_path: Path) -> Any:
-    yaml.add_implicit_resolver("!envvar", _tag_matcher, None, yaml.SafeLoader)
-    yaml.add_constructor("!envvar", _path_constructor, yaml.SafeLoader)
     try:
         with open(config_path, "r") as f:
-            return yaml.safe_load(f.read())
+            return yaml.load(f, Loader=SafeLoader)
     except (FileNotFoundError, PermissionError, ParserError):
         return {}
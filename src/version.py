@@ -1,7 +1,15 @@
 """Dynamic version management for Boxarr using git tags."""
 
+import re
 import subprocess
 from pathlib import Path
+from typing import Optional
+
+# Set at build time (e.g. by the Dockerfile) so no git lookup is needed
+_STATIC_VERSION: Optional[str] = None
+
+# Format: 0.4.1-2-g1234567[-dirty] (from ``git describe --long``)
+_DESCRIBE_RE = re.compile(r"^(?P<tag>.+)-(?P<ahead>\d+)-g[0-9a-f]+(?P<dirty>-dirty)?$")
 
 
 def get_version() -> str:
@@ -11,10 +19,14 @@ def get_version() -> str:
     Returns:
         Version string in format 'x.y.z' or 'x.y.z-dev' if not on a tag
     """
+    if _STATIC_VERSION:
+        return _STATIC_VERSION
+
     try:
-        # Try to get version from git describe
+        # Try to get version from git describe; --long always includes the
+        # commit count since the tag, so one call tells us if we're on a tag
         result = subprocess.run(
-            ["git", "describe", "--tags", "--always", "--dirty"],
+            ["git", "describe", "--tags", "--long", "--always", "--dirty"],
             capture_output=True,
             text=True,
             check=False,
@@ -22,35 +34,25 @@ def get_version() -> str:
         )
 
         if result.returncode == 0:
-            version = result.stdout.strip()
-
-            # Clean up version string
-            if version.startswith("v"):
-                version = version[1:]
-
-            # Check if we're on a tagged commit
-            tag_result = subprocess.run(
-                ["git", "describe", "--exact-match", "--tags"],
-                capture_output=True,
-                text=True,
-                check=False,
-                cwd=Path(__file__).parent.parent,
-            )
-
-            if tag_result.returncode != 0:
-                # Not on a tag, add -dev suffix if not already present
-                if "-" in version:
-                    # Format: v0.4.1-2-g1234567 -> 0.4.1-dev
-                    parts = version.split("-")
-                    base_version = parts[0]
-                    if "dirty" in version:
-                        version = f"{base_version}-dev-dirty"
-                    else:
-                        version = f"{base_version}-dev"
-                else:
-                    # Just a commit hash, use fallback
-                    version = "1.5.4-dev"
+            match = _DESCRIBE_RE.match(result.stdout.strip())
+            if match:
+                version = match.group("tag")
+
+                # Clean up version string
+                if version.startswith("v"):
+                    version = version[1:]
+
+                dirty = match.group("dirty") or ""
+                if match.group("ahead") == "0":
+                    # On a tagged commit
+                    return f"{version}{dirty}"
+
+                # Not on a tag: v0.4.1-2-g1234567 -> 0.4.1-dev
+                base_version = version.split("-")[0]
+                return f"{base_version}-dev{dirty}"
 
+            # Just a commit hash, use fallback
+            version = "1.5.4-dev"
             return version
 
     except (subprocess.SubprocessError, FileNotFoundError):
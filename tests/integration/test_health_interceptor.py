@@ -0,0 +1,94 @@
+"""Integration tests for the ASGI health check interceptor."""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from src.api.app import create_app
+from src.api.health_interceptor import HealthCheckInterceptor
+
+
+def test_health_served_without_radarr_io(monkeypatch):
+    """Health probes answer from memory and never construct a Radarr client."""
+    monkeypatch.setattr("src.utils.config.settings.radarr_api_key", "")
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Radarr must not be contacted on the probe path")
+
+    monkeypatch.setattr("src.api.app._check_radarr_connection", _fail)
+
+    app = create_app()
+    client = TestClient(app)
+
+    response = client.get("/api/health")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["radarr_configured"] is False
+    assert data["radarr_connected"] is False
+
+
+def test_health_rejects_non_get(monkeypatch):
+    """Only GET is accepted on the health path."""
+    monkeypatch.setattr("src.utils.config.settings.radarr_api_key", "")
+
+    client = TestClient(create_app())
+
+    response = client.post("/api/health")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET"
+
+
+def test_other_paths_reach_fastapi(monkeypatch):
+    """Requests outside the health path are passed through to FastAPI."""
+    monkeypatch.setattr("src.utils.config.settings.radarr_api_key", "")
+
+    app = create_app()
+    assert isinstance(app, HealthCheckInterceptor)
+    client = TestClient(app)
+
+    response = client.get("/", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "/setup"
+
+
+def test_health_reports_cached_radarr_status(monkeypatch):
+    """Radarr status comes from the background refresh, not the request."""
+    monkeypatch.setattr("src.utils.config.settings.radarr_api_key", "test_key")
+    monkeypatch.setattr("src.api.app._check_radarr_connection", lambda: True)
+
+    app = create_app()
+    with TestClient(app) as client:
+        data = {}
+        for _ in range(50):
+            data = client.get("/api/health").json()
+            if data["radarr_connected"]:
+                break
+            time.sleep(0.02)
+
+        assert data["radarr_configured"] is True
+        assert data["radarr_connected"] is True
+        assert app.app.state.radarr_status["ts"] > 0
+
+
+def test_health_picks_up_radarr_key_saved_after_startup(monkeypatch):
+    """Saving a Radarr key after startup is reflected by the health check."""
+    monkeypatch.setattr("src.utils.config.settings.radarr_api_key", "")
+    monkeypatch.setattr("src.utils.config.settings.radarr_cache_ttl_seconds", 0.01)
+    monkeypatch.setattr("src.api.app._check_radarr_connection", lambda: True)
+
+    app = create_app()
+    with TestClient(app) as client:
+        assert client.get("/api/health").json()["radarr_connected"] is False
+
+        monkeypatch.setattr("src.utils.config.settings.radarr_api_key", "test_key")
+        data = {}
+        for _ in range(50):
+            data = client.get("/api/health").json()
+            if data["radarr_connected"]:
+                break
+            time.sleep(0.02)
+
+        assert data["radarr_configured"] is True
+        assert data["radarr_connected"] is True
@@ -0,0 +1,74 @@
+"""Integration tests for in-memory cached static files."""
+
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.api.app import create_app
+from src.api.static_files import CachedStaticFiles
+
+
+def _static_app(app) -> CachedStaticFiles:
+    for route in app.app.routes:
+        if getattr(route, "name", None) == "static":
+            return route.app
+    raise AssertionError("static mount not found")
+
+
+def test_static_asset_served_from_cache():
+    """Repeated requests return the same bytes and populate the cache once."""
+    app = create_app()
+    client = TestClient(app)
+
+    first = client.get("/static/css/style.css")
+    assert first.status_code == 200
+    assert "text/css" in first.headers["content-type"]
+
+    static = _static_app(app)
+    assert len(static._cache) == 1
+
+    second = client.get("/static/css/style.css?v=3")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(static._cache) == 1
+
+
+def test_cached_asset_honours_if_none_match():
+    """Conditional requests against a cached asset get a 304."""
+    client = TestClient(create_app())
+
+    etag = client.get("/static/js/app.js").headers["etag"]
+    response = client.get("/static/js/app.js", headers={"if-none-match": etag})
+    assert response.status_code == 304
+
+
+def test_missing_asset_is_not_cached():
+    """Unknown paths still 404 and are not stored."""
+    app = create_app()
+    client = TestClient(app)
+
+    assert client.get("/static/does-not-exist.css").status_code == 404
+    assert len(_static_app(app)._cache) == 0
+
+
+def test_concurrent_misses_count_bytes_once():
+    """Simultaneous first requests for one asset don't inflate the byte total."""
+    app = create_app()
+    static = _static_app(app)
+
+    async def _fetch_concurrently():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await asyncio.gather(
+                *(client.get("/static/css/style.css") for _ in range(10))
+            )
+
+    responses = asyncio.run(_fetch_concurrently())
+    assert all(r.status_code == 200 for r in responses)
+
+    assert len(static._cache) == 1
+    assert static._cache_bytes == len(responses[0].content)
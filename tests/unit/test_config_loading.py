@@ -0,0 +1,78 @@
+"""Unit tests for YAML config flattening and config file discovery."""
+
+from pathlib import Path
+
+import yaml
+
+from src.utils.config import _flatten, _list_files, load_settings
+
+
+def test_flatten_prefixes_known_sections():
+    cfg = {
+        "radarr": {"url": "http://radarr:7878", "api_key": "key"},
+        "boxarr": {
+            "scheduler": {"enabled": True, "cron": "0 1 * * 1"},
+            "features": {"auto_add": True, "auto_add_options": {"limit": 5}},
+            "ui": {"theme": "dark", "cards_per_row": {"mobile": 2}},
+            "data": {"directory": "/data"},
+        },
+    }
+    assert dict(_flatten(cfg)) == {
+        "radarr_url": "http://radarr:7878",
+        "radarr_api_key": "key",
+        "boxarr_scheduler_enabled": True,
+        "boxarr_scheduler_cron": "0 1 * * 1",
+        "boxarr_features_auto_add": True,
+        "boxarr_features_auto_add_limit": 5,
+        "boxarr_ui_theme": "dark",
+        "boxarr_ui_cards_per_row_mobile": 2,
+        "boxarr_data_directory": "/data",
+    }
+
+
+def test_flatten_keeps_other_mappings_whole():
+    """Nested mappings outside the section table are passed through as values."""
+    root_folder_config = {"enabled": True, "mappings": []}
+    cfg = {
+        "radarr": {"root_folder_config": root_folder_config},
+        "log_level": "DEBUG",
+        "extra": {"key": "value"},
+    }
+    assert list(_flatten(cfg)) == [
+        ("radarr_root_folder_config", root_folder_config),
+        ("log_level", "DEBUG"),
+        ("extra", {"key": "value"}),
+    ]
+
+
+def _write_config(path: Path, log_level: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"log_level": log_level}))
+
+
+def test_list_files_returns_regular_files_only(tmp_path: Path):
+    (tmp_path / "config.yaml").write_text("")
+    (tmp_path / "local.yaml").mkdir()
+    assert _list_files(tmp_path) == {"config.yaml"}
+    assert _list_files(tmp_path / "missing") == set()
+
+
+def test_load_settings_prefers_data_directory(tmp_path: Path, monkeypatch):
+    data_dir = tmp_path / "data"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BOXARR_DATA_DIRECTORY", str(data_dir))
+    _write_config(tmp_path / "config" / "local.yaml", "ERROR")
+    _write_config(data_dir / "config.yaml", "WARNING")
+
+    assert load_settings().log_level == "WARNING"
+
+    _write_config(data_dir / "local.yaml", "DEBUG")
+    assert load_settings().log_level == "DEBUG"
+
+
+def test_load_settings_falls_back_to_config_directory(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BOXARR_DATA_DIRECTORY", str(tmp_path / "missing"))
+    _write_config(tmp_path / "config" / "default.yaml", "ERROR")
+
+    assert load_settings().log_level == "ERROR"
@@ -5,6 +5,9 @@ The current implementation supports case-insensitive matching and priority
 tie‑breaking; these tests verify that behavior.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from src.utils.config import (
     RootFolderConfig,
     RootFolderMapping,
@@ -55,3 +58,36 @@ def test_mapping_is_case_insensitive_expected_behavior():
 
     # Input uses different case; desired behavior is to still match.
     assert s.get_root_folder_for_genres(["science fiction"]) == "/movies/scifi"
+
+
+def test_reassigning_mappings_refreshes_normalized_cache():
+    """Replacing the mapping list is picked up by subsequent lookups."""
+    s = make_settings_with_mappings(
+        [RootFolderMapping(genres=["Horror"], root_folder="/movies/horror")]
+    )
+    assert s.get_root_folder_for_genres(["horror"]) == "/movies/horror"
+
+    s.radarr_root_folder_config.mappings = [
+        RootFolderMapping(genres=["Horror"], root_folder="/movies/scary")
+    ]
+    assert s.get_root_folder_for_genres(["horror"]) == "/movies/scary"
+    assert isinstance(s.radarr_root_folder_config.mappings, tuple)
+
+
+def test_mappings_cannot_be_mutated_in_place():
+    """In-place edits are rejected so the normalized mappings can't go stale."""
+    s = make_settings_with_mappings(
+        [RootFolderMapping(genres=["Horror"], root_folder="/movies/horror")]
+    )
+    assert s.get_root_folder_for_genres(["horror"]) == "/movies/horror"
+
+    config = s.radarr_root_folder_config
+    with pytest.raises(AttributeError):
+        config.mappings.append(
+            RootFolderMapping(genres=["Comedy"], root_folder="/movies/comedy")
+        )
+    with pytest.raises(ValidationError):
+        config.mappings[0].root_folder = "/movies/scary"
+
+    assert s.get_root_folder_for_genres(["horror"]) == "/movies/horror"
+    assert s.get_root_folder_for_genres(["comedy"]) != "/movies/comedy"
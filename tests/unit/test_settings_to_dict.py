@@ -0,0 +1,57 @@
+"""Unit tests for ``Settings.to_dict``."""
+
+from pathlib import Path
+
+import yaml
+
+from src.utils.config import Settings
+
+
+def test_to_dict_masks_api_key():
+    s = Settings(radarr_api_key="secret")
+    assert s.to_dict()["radarr_api_key"] == "***"
+    assert s.to_dict(include_sensitive=True)["radarr_api_key"] == "secret"
+
+
+def test_to_dict_returns_independent_copies():
+    s = Settings()
+    first = s.to_dict()
+    first["log_level"] = "CHANGED"
+    assert s.to_dict()["log_level"] == s.log_level
+
+
+def test_to_dict_reflects_field_assignment():
+    s = Settings()
+    assert s.to_dict()["log_level"] == "INFO"
+    s.log_level = "DEBUG"
+    assert s.to_dict()["log_level"] == "DEBUG"
+
+
+def test_to_dict_reflects_yaml_load(tmp_path: Path):
+    s = Settings()
+    assert s.to_dict()["boxarr_scheduler_cron"] == "0 23 * * 2"
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.safe_dump({"boxarr": {"scheduler": {"cron": "0 1 * * 1"}}})
+    )
+    s.load_from_yaml(config_path)
+    assert s.to_dict()["boxarr_scheduler_cron"] == "0 1 * * 1"
+
+
+def test_to_dict_reflects_nested_mutation():
+    s = Settings()
+    assert s.to_dict()["radarr_root_folder_config"]["enabled"] is False
+    s.radarr_root_folder_config.enabled = True
+    assert s.to_dict()["radarr_root_folder_config"]["enabled"] is True
+
+
+def test_to_dict_nested_values_not_shared():
+    s = Settings()
+    first = s.to_dict()
+    first["radarr_root_folder_config"]["enabled"] = True
+    first["boxarr_cors_origins"].append("https://example.com")
+
+    second = s.to_dict()
+    assert second["radarr_root_folder_config"]["enabled"] is False
+    assert second["boxarr_cors_origins"] == ["*"]
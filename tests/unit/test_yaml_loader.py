@@ -0,0 +1,40 @@
+"""Unit tests for environment variable substitution in ``load_yaml``."""
+
+from pathlib import Path
+
+from src.utils.yaml_loader import load_yaml
+
+
+def _load(tmp_path: Path, content: str):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(content)
+    return load_yaml(config_path)
+
+
+def test_env_var_is_substituted(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("BOXARR_TEST_KEY", "secret")
+    data = _load(tmp_path, "radarr:\n  api_key: ${BOXARR_TEST_KEY:unused}\n")
+    assert data["radarr"]["api_key"] == "secret"
+
+
+def test_default_may_contain_colons(tmp_path: Path, monkeypatch):
+    """Everything after the first colon is the default, URLs included."""
+    monkeypatch.delenv("BOXARR_TEST_URL", raising=False)
+    data = _load(tmp_path, "radarr:\n  url: ${BOXARR_TEST_URL:http://radarr:7878}\n")
+    assert data["radarr"]["url"] == "http://radarr:7878"
+
+
+def test_unset_var_without_default_is_empty(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("BOXARR_TEST_KEY", raising=False)
+    data = _load(tmp_path, "radarr:\n  api_key: ${BOXARR_TEST_KEY}\n")
+    assert data["radarr"]["api_key"] == ""
+
+
+def test_multiple_occurrences_in_one_value(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("BOXARR_TEST_HOST", "radarr")
+    monkeypatch.delenv("BOXARR_TEST_PORT", raising=False)
+    data = _load(
+        tmp_path,
+        "radarr:\n  url: http://${BOXARR_TEST_HOST}:${BOXARR_TEST_PORT:7878}\n",
+    )
+    assert data["radarr"]["url"] == "http://radarr:7878"